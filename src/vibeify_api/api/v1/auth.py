@@ -2,7 +2,9 @@
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from vibeify_api.core.database import get_db
 from vibeify_api.core.dependencies import get_current_user
 from vibeify_api.core.security import create_access_token, get_password_hash, verify_password
 from vibeify_api.core.config import get_settings
@@ -17,6 +19,7 @@ router = APIRouter(prefix="", tags=["auth"])
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserRegister,
+    session: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Register a new user.
 
@@ -29,13 +32,14 @@ async def register(
     Raises:
         HTTPException: If email or username already exists
     """
-    user_service = UserService()
+    user_service = UserService(session)
     return await user_service.register_user(user_data)
 
 
 @router.post("/login", response_model=Token)
 async def login(
     user_data: UserLogin,
+    session: AsyncSession = Depends(get_db),
 ) -> Token:
     """Authenticate user and return JWT token.
 
@@ -48,13 +52,14 @@ async def login(
     Raises:
         HTTPException: If credentials are invalid
     """
-    user_service = UserService()
+    user_service = UserService(session)
     return await user_service.login_user(user_data)
 
 
 @router.get("/profile", response_model=UserResponse)
 async def get_user_profile(
     current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
 ) -> UserResponse:
     """Get current authenticated user information.
 
@@ -64,5 +69,5 @@ async def get_user_profile(
     Returns:
         Current user information
     """
-    user_service = UserService()
+    user_service = UserService(session)
     return await user_service.get_user_profile(current_user.id)
@@ -3,7 +3,9 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, UploadFile, status
 from querymate import PaginatedResponse, Querymate
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from vibeify_api.core.database import get_db
 from vibeify_api.core.dependencies import get_current_user
 from vibeify_api.models.user import User
 from vibeify_api.schemas.document import DocumentResponse, DocumentUploadResponse
@@ -12,9 +14,9 @@ from vibeify_api.services.document import DocumentService
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 
-def get_document_service() -> DocumentService:
+def get_document_service(session: AsyncSession = Depends(get_db)) -> DocumentService:
     """Dependency to get document service instance."""
-    return DocumentService()
+    return DocumentService(session)
 
 
 @router.post(
@@ -3,7 +3,9 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, status, Path
 from querymate import PaginatedResponse, Querymate
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from vibeify_api.core.database import get_db
 from vibeify_api.models.user import User
 from vibeify_api.schemas.auth import UserResponse
 from vibeify_api.services.user import UserService
@@ -11,9 +13,9 @@ from vibeify_api.services.user import UserService
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-def get_user_service() -> UserService:
+def get_user_service(session: AsyncSession = Depends(get_db)) -> UserService:
     """Dependency to get user service instance."""
-    return UserService()
+    return UserService(session)
 
 
 @router.get(
@@ -3,7 +3,9 @@ from typing import Optional
 
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from vibeify_api.core.database import get_db
 from vibeify_api.core.exceptions import AuthenticationError, AuthorizationError
 from vibeify_api.core.security import decode_access_token
 from vibeify_api.models.user import User
@@ -15,6 +17,7 @@ security = HTTPBearer()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_db),
 ) -> User:
     """Get the current authenticated user from JWT token.
     
@@ -30,7 +33,7 @@ async def get_current_user(
     if user_id is None:
         raise AuthenticationError("Could not validate credentials")
     
-    user_service = UserService()
+    user_service = UserService(session)
     user = await user_service.get(int(user_id))
     
     if not user.is_active:
@@ -0,0 +1,67 @@
+"""S3 client connection management."""
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import aioboto3
+
+from vibeify_api.core.config import get_settings
+
+settings = get_settings()
+
+# Shared session and client, opened for the app lifetime by init_s3()
+session = aioboto3.Session()
+s3_client: Optional[Any] = None
+_exit_stack: Optional[AsyncExitStack] = None
+
+
+def get_client_kwargs() -> dict[str, Any]:
+    """Build S3 client keyword arguments from settings.
+
+    Returns:
+        Dictionary of client credentials, region and optional endpoint
+    """
+    client_kwargs = {
+        "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
+        "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
+        "region_name": settings.AWS_REGION,
+    }
+    if settings.S3_ENDPOINT_URL:
+        client_kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
+    return client_kwargs
+
+
+@asynccontextmanager
+async def get_s3_client() -> AsyncIterator[Any]:
+    """Get an S3 client.
+
+    Yields the shared client when the app has started one, otherwise a
+    short-lived client (e.g. in Celery workers or scripts).
+
+    Yields:
+        aiobotocore S3 client
+    """
+    if s3_client is not None:
+        yield s3_client
+        return
+    async with session.client("s3", **get_client_kwargs()) as client:
+        yield client
+
+
+async def init_s3() -> None:
+    """Open the shared S3 client."""
+    global s3_client, _exit_stack
+    if s3_client is not None:
+        return
+    _exit_stack = AsyncExitStack()
+    s3_client = await _exit_stack.enter_async_context(
+        session.client("s3", **get_client_kwargs())
+    )
+
+
+async def close_s3() -> None:
+    """Close the shared S3 client."""
+    global s3_client, _exit_stack
+    if _exit_stack is not None:
+        await _exit_stack.aclose()
+    s3_client = None
+    _exit_stack = None
@@ -4,13 +4,14 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from vibeify_api.api.v1.router import api_router
 from vibeify_api.core.config import get_settings
 from vibeify_api.core.database import close_db, init_db
 from vibeify_api.core.exceptions import ServiceException
 from vibeify_api.core.logging import get_logger, setup_logging
+from vibeify_api.core.s3 import close_s3, init_s3
 
 settings = get_settings()
 
@@ -22,8 +23,10 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     await init_db()
+    await init_s3()
     yield
     # Shutdown
+    await close_s3()
     await close_db()
 
 
@@ -32,6 +35,7 @@ app = FastAPI(
     version=settings.VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -1,7 +1,11 @@
 """Base repository for database operations."""
-from typing import Generic, TypeVar, Optional, Type, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generic, TypeVar, Optional, Type, Any
 
-from sqlalchemy import select
+from querymate import PaginatedResponse, Querymate
+from querymate.core.query_builder import QueryBuilder
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
 from vibeify_api.core.database import AsyncSessionLocal
@@ -13,16 +17,32 @@ class BaseRepository(Generic[ModelType]):
     """Generic repository base class for database operations.
 
     Provides common CRUD operations that can be extended by specific repositories.
-    Manages its own database session lifecycle.
+    Uses the session it is given (e.g. one per request), or opens a short-lived
+    session per operation when none is provided.
     """
 
-    def __init__(self, model: Type[ModelType]):
+    def __init__(self, model: Type[ModelType], session: Optional[AsyncSession] = None):
         """Initialize repository with model.
 
         Args:
             model: SQLModel class
+            session: Optional session shared across operations
         """
         self.model = model
+        self.session = session
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """Yield the shared session, or a new one closed on exit.
+
+        Yields:
+            AsyncSession: Database session
+        """
+        if self.session is not None:
+            yield self.session
+            return
+        async with AsyncSessionLocal() as session:
+            yield session
 
     async def get(self, id: int) -> Optional[ModelType]:
         """Get a single record by ID.
@@ -33,7 +53,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Model instance or None if not found
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             query = select(self.model).where(self.model.id == id)
             result = await session.execute(query)
             return result.scalar_one_or_none()
@@ -52,10 +72,10 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             query = select(self.model).offset(skip).limit(limit)
             result = await session.execute(query)
-            return list(result.scalars().all())
+            return result.scalars().all()
 
     async def create(self, obj_in: ModelType | dict[str, Any]) -> ModelType:
         """Create a new record.
@@ -66,7 +86,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Created model instance
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             if isinstance(obj_in, dict):
                 db_obj = self.model(**obj_in)
             else:
@@ -78,15 +98,73 @@ class BaseRepository(Generic[ModelType]):
             return db_obj
 
     async def query(self, query):
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             return await query.run_async(session, self.model)
 
     async def query_paginated(self, query):
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             return await query.run_async_paginated(session, self.model)
 
+    async def query_paginated_windowed(self, query: Querymate) -> PaginatedResponse:
+        """Query records with pagination, fetching the total in the same statement.
+
+        Adds ``count(*) OVER ()`` to the page query so the total comes back
+        with the rows instead of from a second ``SELECT COUNT(*)``. Falls back
+        to ``query_paginated`` when a to-many relationship is selected, since
+        the joined rows would inflate the window count.
+
+        Args:
+            query: QueryMate instance with filters, sort, select, etc.
+
+        Returns:
+            Paginated response with serialized items and pagination metadata
+        """
+        builder = QueryBuilder(model=self.model)
+        builder.build(
+            select=query.select,
+            filter=query.filter,
+            sort=query.sort,
+            limit=query.limit,
+            offset=query.offset,
+            join_type=query.join_type,
+        )
+        if self._selects_collection(builder.select):
+            return await self.query_paginated(query)
+
+        stmt = builder.query.add_columns(func.count().over().label("__total"))
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).all()
+            if rows:
+                total = rows[0][-1]
+            elif query.offset:
+                # Past the last page the window has no row to ride on
+                total = await builder.count_async(session)
+            else:
+                total = 0
+
+        items = builder.serialize(builder.reconstruct_objects(rows, self.model))
+        return PaginatedResponse(items=items, pagination=query._pagination(total))
+
+    def _selects_collection(self, fields: list) -> bool:
+        """Check whether a QueryMate selection joins a to-many relationship.
+
+        Args:
+            fields: Normalized QueryMate field selection
+
+        Returns:
+            True if any selected relationship is a collection
+        """
+        relationships = inspect(self.model).relationships
+        for field in fields:
+            if isinstance(field, dict):
+                for name in field:
+                    rel = relationships.get(name)
+                    if rel is not None and rel.uselist:
+                        return True
+        return False
+
     async def query_raw(self, query):
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             return await query.run_raw_async(session, self.model)
 
     async def update(
@@ -103,22 +181,20 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Updated model instance or None if not found
         """
-        async with AsyncSessionLocal() as session:
-            query = select(self.model).where(self.model.id == id)
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get(id)
+
+        async with self._session() as session:
+            query = (
+                update(self.model)
+                .where(self.model.id == id)
+                .values(**update_data)
+                .returning(self.model)
+            )
             result = await session.execute(query)
             db_obj = result.scalar_one_or_none()
-            
-            if not db_obj:
-                return None
-
-            update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
-
-            for field, value in update_data.items():
-                setattr(db_obj, field, value)
-
-            session.add(db_obj)
             await session.commit()
-            await session.refresh(db_obj)
             return db_obj
 
     async def delete(self, id: int) -> bool:
@@ -130,7 +206,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if deleted, False if not found
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             query = select(self.model).where(self.model.id == id)
             result = await session.execute(query)
             db_obj = result.scalar_one_or_none()
@@ -151,7 +227,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if exists, False otherwise
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             query = select(self.model).where(self.model.id == id)
             result = await session.execute(query)
             return result.scalar_one_or_none() is not None
@@ -162,7 +238,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Total count
         """
-        async with AsyncSessionLocal() as session:
+        async with self._session() as session:
             query = select(self.model)
             result = await session.execute(query)
             return len(list(result.scalars().all()))
@@ -1,22 +1,34 @@
 """S3 repository for file storage operations."""
-from typing import Optional, BinaryIO
-import uuid
-from datetime import datetime
+import asyncio
+import os
+import time
+from typing import Iterable, Optional, BinaryIO
+from datetime import UTC, datetime
 
-import aioboto3
+import botocore.session
+from botocore.client import BaseClient
 
 from vibeify_api.core.config import get_settings
+from vibeify_api.core.s3 import get_client_kwargs, get_s3_client
 
 settings = get_settings()
 
-_s3_session: Optional[aioboto3.Session] = None
+_s3_signing_client: Optional[BaseClient] = None
+
+# Characters replaced with "_" in uploaded filenames
+_FILENAME_TRANSLATE_TABLE = str.maketrans({" ": "_", "/": "_"})
+
+# Presigned GET URLs keyed by (bucket, key, expiration) -> (url, expires_at)
+_PRESIGNED_URL_CACHE_MAX_SIZE = 10_000
+_PRESIGNED_URL_MIN_REMAINING = 60
+_presigned_url_cache: dict[tuple[str, str, int], tuple[str, float]] = {}
 
 
 class S3Repository:
     """Repository for S3 file storage operations.
     
     Provides abstraction over S3 operations for file storage and retrieval.
-    Uses a singleton session for efficient connection reuse.
+    Uses the app-wide S3 client for efficient connection reuse.
     """
 
     def __init__(self, bucket_name: Optional[str] = None):
@@ -26,24 +38,28 @@ class S3Repository:
             bucket_name: S3 bucket name (defaults to settings.S3_BUCKET_NAME)
         """
         self.bucket_name = bucket_name or settings.S3_BUCKET_NAME
-        self._session = self._get_session()
 
     @staticmethod
-    def _get_session() -> aioboto3.Session:
-        """Get or create singleton S3 session.
-        
+    def _get_signing_client() -> BaseClient:
+        """Get or create singleton botocore client used for URL signing.
+
+        Presigning is a local HMAC computation, so a plain botocore client
+        avoids opening an aiohttp connector just to sign a URL.
+
         Returns:
-            aioboto3.Session instance
+            botocore S3 client
         """
-        global _s3_session
-        if _s3_session is None:
-            _s3_session = aioboto3.Session()
-        return _s3_session
+        global _s3_signing_client
+        if _s3_signing_client is None:
+            _s3_signing_client = botocore.session.get_session().create_client(
+                "s3", **get_client_kwargs()
+            )
+        return _s3_signing_client
 
     def generate_key(self, filename: str, user_id: Optional[int] = None) -> str:
         """Generate a predictable S3 key for a file.
         
-        Format: {year}/{month}/{day}/{user_id}/{uuid}-{filename}
+        Format: {year}/{month}/{day}/{user_id}/{random_hex}-{filename}
         
         Args:
             filename: Original filename
@@ -52,24 +68,26 @@ class S3Repository:
         Returns:
             S3 key string
         """
-        now = datetime.utcnow()
-        date_prefix = f"{now.year}/{now.month:02d}/{now.day:02d}"
-        file_uuid = str(uuid.uuid4())
+        now = datetime.now(UTC)
+        date_prefix = now.strftime("%Y/%m/%d")
+        file_id = os.urandom(16).hex()
         
         # Sanitize filename
-        safe_filename = filename.replace(" ", "_").replace("/", "_")
+        safe_filename = filename.translate(_FILENAME_TRANSLATE_TABLE)
         
         if user_id:
-            return f"{date_prefix}/{user_id}/{file_uuid}-{safe_filename}"
-        return f"{date_prefix}/{file_uuid}-{safe_filename}"
+            return f"{date_prefix}/{user_id}/{file_id}-{safe_filename}"
+        return f"{date_prefix}/{file_id}-{safe_filename}"
 
-    async def generate_presigned_url(
+    def generate_presigned_url(
         self,
         s3_key: str,
         operation: str = "put_object",
         expiration: Optional[int] = None,
     ) -> str:
         """Generate a presigned URL for S3 operations.
+
+        Signing is local, so no request is made and nothing is awaited.
         
         Args:
             s3_key: S3 object key
@@ -80,29 +98,30 @@ class S3Repository:
             Presigned URL string
         """
         expiration = expiration or settings.S3_PRESIGNED_URL_EXPIRATION
-        
-        client_kwargs = {
-            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
-            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
-            "region_name": settings.AWS_REGION,
-        }
-        if settings.S3_ENDPOINT_URL:
-            client_kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
-        
-        async with self._session.client("s3", **client_kwargs) as s3_client:
-            if operation == "put_object":
-                url = await s3_client.generate_presigned_url(
-                    "put_object",
-                    Params={"Bucket": self.bucket_name, "Key": s3_key},
-                    ExpiresIn=expiration,
-                )
-            else:  # get_object
-                url = await s3_client.generate_presigned_url(
-                    "get_object",
-                    Params={"Bucket": self.bucket_name, "Key": s3_key},
-                    ExpiresIn=expiration,
-                )
-            return url
+        if operation == "put_object":
+            return self._sign(operation, s3_key, expiration)
+
+        # Download URLs are reused while they stay valid, so clients can
+        # cache the object under a stable URL
+        cache_key = (self.bucket_name, s3_key, expiration)
+        now = time.time()
+        cached = _presigned_url_cache.get(cache_key)
+        if cached is not None and cached[1] - now > _PRESIGNED_URL_MIN_REMAINING:
+            return cached[0]
+
+        url = self._sign("get_object", s3_key, expiration)
+        if cached is None and len(_presigned_url_cache) >= _PRESIGNED_URL_CACHE_MAX_SIZE:
+            _presigned_url_cache.pop(next(iter(_presigned_url_cache)))
+        _presigned_url_cache[cache_key] = (url, now + expiration)
+        return url
+
+    def _sign(self, operation: str, s3_key: str, expiration: int) -> str:
+        """Sign a URL for an S3 operation on a key in this bucket."""
+        return self._get_signing_client().generate_presigned_url(
+            operation,
+            Params={"Bucket": self.bucket_name, "Key": s3_key},
+            ExpiresIn=expiration,
+        )
 
     async def upload_file(
         self,
@@ -120,15 +139,7 @@ class S3Repository:
         Returns:
             Dictionary with upload result
         """
-        client_kwargs = {
-            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
-            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
-            "region_name": settings.AWS_REGION,
-        }
-        if settings.S3_ENDPOINT_URL:
-            client_kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
-        
-        async with self._session.client("s3", **client_kwargs) as s3_client:
+        async with get_s3_client() as s3_client:
             extra_args = {}
             if content_type:
                 extra_args["ContentType"] = content_type
@@ -151,15 +162,7 @@ class S3Repository:
         Returns:
             True if deleted successfully
         """
-        client_kwargs = {
-            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
-            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
-            "region_name": settings.AWS_REGION,
-        }
-        if settings.S3_ENDPOINT_URL:
-            client_kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
-        
-        async with self._session.client("s3", **client_kwargs) as s3_client:
+        async with get_s3_client() as s3_client:
             await s3_client.delete_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
@@ -175,15 +178,7 @@ class S3Repository:
         Returns:
             True if file exists
         """
-        client_kwargs = {
-            "aws_access_key_id": settings.AWS_ACCESS_KEY_ID,
-            "aws_secret_access_key": settings.AWS_SECRET_ACCESS_KEY,
-            "region_name": settings.AWS_REGION,
-        }
-        if settings.S3_ENDPOINT_URL:
-            client_kwargs["endpoint_url"] = settings.S3_ENDPOINT_URL
-        
-        async with self._session.client("s3", **client_kwargs) as s3_client:
+        async with get_s3_client() as s3_client:
             try:
                 await s3_client.head_object(
                     Bucket=self.bucket_name,
@@ -192,3 +187,26 @@ class S3Repository:
                 return True
             except s3_client.exceptions.ClientError:
                 return False
+
+    async def list_keys(self, prefixes: Iterable[str]) -> set[str]:
+        """List the object keys stored under the given prefixes.
+
+        All prefixes are listed concurrently over a single client.
+        
+        Args:
+            prefixes: Key prefixes to list (e.g. "2026/01/18/1/")
+            
+        Returns:
+            Set of existing object keys
+        """
+        async with get_s3_client() as s3_client:
+            paginator = s3_client.get_paginator("list_objects_v2")
+
+            async def list_prefix(prefix: str) -> list[str]:
+                keys = []
+                async for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                    keys.extend(obj["Key"] for obj in page.get("Contents", []))
+                return keys
+
+            results = await asyncio.gather(*(list_prefix(prefix) for prefix in set(prefixes)))
+            return {key for keys in results for key in keys}
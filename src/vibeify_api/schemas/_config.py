@@ -0,0 +1,16 @@
+"""Shared Pydantic configuration for API schemas."""
+from pydantic import ConfigDict
+from pydantic.alias_generators import to_camel
+
+ORM_CONFIG: ConfigDict = ConfigDict(
+    from_attributes=True,
+    defer_build=False,
+    validate_assignment=False,
+    ser_json_bytes="base64",
+)
+
+CAMEL_CONFIG: ConfigDict = ConfigDict(
+    **ORM_CONFIG,
+    alias_generator=to_camel,
+    populate_by_name=True,
+)
@@ -1,9 +1,12 @@
 """Authentication schemas."""
 import datetime
+from dataclasses import dataclass
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field
 
+from vibeify_api.schemas.base import OrmModel
+
 class Token(BaseModel):
     """JWT token response schema."""
 
@@ -11,7 +14,8 @@ class Token(BaseModel):
     token_type: str = "bearer"
 
 
-class TokenData(BaseModel):
+@dataclass(slots=True)
+class TokenData:
     """Token payload data."""
 
     user_id: Optional[int] = None
@@ -33,7 +37,7 @@ class UserRegister(BaseModel):
     full_name: Optional[str] = Field(default=None, max_length=200)
 
 
-class RoleResponse(BaseModel):
+class RoleResponse(OrmModel):
     """Role response schema."""
     
     id: int
@@ -41,13 +45,8 @@ class RoleResponse(BaseModel):
     description: Optional[str]
     is_active: bool
 
-    class Config:
-        """Pydantic configuration."""
-        
-        from_attributes = True
-
 
-class UserResponse(BaseModel):
+class UserResponse(OrmModel):
     """User response schema (excludes sensitive fields)."""
 
     id: int
@@ -59,8 +58,3 @@ class UserResponse(BaseModel):
     role_id: Optional[int] = None
     created_at: Optional[datetime.datetime] = None
     updated_at: Optional[datetime.datetime] = None
-
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
@@ -0,0 +1,20 @@
+"""Base schema classes."""
+from pydantic import BaseModel
+
+from vibeify_api.schemas._config import CAMEL_CONFIG, ORM_CONFIG
+
+
+class OrmModel(BaseModel):
+    """Base schema validated from ORM objects, serialized with field names.
+
+    Validators and serializers are built when the class is defined
+    (``defer_build=False``) so the first request does not pay the cost.
+    """
+
+    model_config = ORM_CONFIG
+
+
+class CamelModel(OrmModel):
+    """Base schema serialized with camelCase aliases."""
+
+    model_config = CAMEL_CONFIG
@@ -2,11 +2,13 @@
 import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
-from pydantic.alias_generators import to_camel
+from pydantic import Field, computed_field
 
+from vibeify_api.repository.s3 import S3Repository
+from vibeify_api.schemas.base import CamelModel
 
-class DocumentResponse(BaseModel):
+
+class DocumentResponse(CamelModel):
     """Document response schema."""
 
     id: Optional[int] = None
@@ -23,19 +25,17 @@ class DocumentResponse(BaseModel):
     updated_at: Optional[datetime.datetime] = None
     download_url: Optional[str] = None
 
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True,
-        from_attributes=True
-    )
-
-class DocumentUploadResponse(BaseModel):
+class DocumentUploadResponse(CamelModel):
     document: DocumentResponse
-    upload_url: Optional[str] = None
     s3_key: str
+    presigned: bool = Field(default=True, exclude=True)
 
-    model_config = ConfigDict(
-        alias_generator=to_camel,
-        populate_by_name=True,
-        from_attributes=True
-    )
+    @computed_field
+    @property
+    def upload_url(self) -> Optional[str]:
+        """Presigned upload URL, signed only when the response is serialized."""
+        if not self.presigned:
+            return None
+        return S3Repository(self.document.s3_bucket).generate_presigned_url(
+            self.s3_key, operation="put_object"
+        )
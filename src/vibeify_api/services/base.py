@@ -1,11 +1,12 @@
 """Base service for business logic layer."""
+from functools import cached_property
 from typing import Generic, List, TypeVar, Optional, Type, Any
 
 from querymate import Querymate
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
 from vibeify_api.core.context import get_current_user_from_context, require_current_user
-from vibeify_api.core.database import AsyncSessionLocal
 from vibeify_api.core.exceptions import NotFoundError
 from vibeify_api.models.user import User
 from vibeify_api.repository.base import BaseRepository
@@ -19,14 +20,23 @@ class BaseService(Generic[ModelType]):
     Combines repository layer with QueryMate for flexible querying.
     """
 
-    def __init__(self, model: Type[ModelType]):
+    def __init__(self, model: Type[ModelType], session: Optional[AsyncSession] = None):
         """Initialize service with model.
 
         Args:
             model: SQLModel class
+            session: Optional request-scoped session shared by all queries
         """
         self.model = model
-        self.repository = BaseRepository(model)
+        self.session = session
+
+    @cached_property
+    def repository(self) -> BaseRepository[ModelType]:
+        """Repository bound to this service's model and session.
+
+        Built on first use and reused for the lifetime of the service.
+        """
+        return BaseRepository(self.model, self.session)
 
     async def get(self, id: int) -> ModelType:
         """Get a single record by ID.
@@ -131,7 +141,7 @@ class BaseService(Generic[ModelType]):
         Returns:
             Paginated response with items and pagination metadata
         """
-        return await self.repository.query_paginated(query)
+        return await self.repository.query_paginated_windowed(query)
 
     async def query_raw(
         self,
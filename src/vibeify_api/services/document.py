@@ -1,8 +1,11 @@
 """Document service for business logic."""
+import os
 from pathlib import Path
+from typing import Optional
 
 from fastapi import UploadFile
 from querymate import PaginatedResponse, Querymate
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vibeify_api.core.config import get_settings
 from vibeify_api.core.exceptions import NotFoundError
@@ -18,11 +21,35 @@ settings = get_settings()
 class DocumentService(BaseService[Document]):
     """Service for document-related business logic."""
 
-    def __init__(self):
-        """Initialize document service."""
-        super().__init__(Document)
+    def __init__(self, session: Optional[AsyncSession] = None):
+        """Initialize document service.
+
+        Args:
+            session: Optional request-scoped session
+        """
+        super().__init__(Document, session)
         self.s3_repo = S3Repository()
 
+    @staticmethod
+    def _file_size(file: UploadFile) -> int:
+        """Get the size of an uploaded file without reading its contents.
+
+        Starlette records the size while parsing the multipart body; when it
+        is missing, seek to the end of the spooled file instead of reading it.
+
+        Args:
+            file: The uploaded file
+
+        Returns:
+            File size in bytes
+        """
+        if file.size is not None:
+            return file.size
+        position = file.file.tell()
+        size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(position)
+        return size
+
     async def upload_file(
         self,
         file: UploadFile,
@@ -52,24 +79,20 @@ class DocumentService(BaseService[Document]):
                 file_extension=file_ext,
                 original_filename=file.filename,
                 content_type=file.content_type,
-                file_size=file.size,
+                file_size=self._file_size(file),
                 s3_key=s3_key,
                 s3_bucket=self.s3_repo.bucket_name,
                 uploaded_by_id=user_id,
             )
         )
 
-        upload_url = None
-
-        if presigned:
-            upload_url = await self.s3_repo.generate_presigned_url(s3_key, operation="put_object")
-        else:
+        if not presigned:
             await self.s3_repo.upload_file(s3_key, file.file)
 
         return DocumentUploadResponse(
             document=DocumentResponse.model_validate(document),
-            upload_url=upload_url,
-            s3_key=s3_key
+            s3_key=s3_key,
+            presigned=presigned,
         )
 
     async def list(
@@ -84,27 +107,33 @@ class DocumentService(BaseService[Document]):
         Returns:
             Paginated response with document instances
         """
-        results: PaginatedResponse[Document] = await self.repository.query_paginated(query)
-        
-        # Add download URLs to each document
-        items = []
-        for doc in results.items:
-            
+        results: PaginatedResponse[dict] = await self.repository.query_paginated_windowed(query)
+
+        docs = [doc for doc in results.items if doc.get("s3_key")]
+
+        # Keys are grouped under {date}/{user_id}/, so one listing per prefix
+        # tells us which uploads actually landed in S3
+        if docs:
+            try:
+                existing = await self.s3_repo.list_keys(
+                    doc["s3_key"].rpartition("/")[0] + "/" for doc in docs
+                )
+                docs = [doc for doc in docs if doc["s3_key"] in existing]
+            except Exception:
+                # If the listing fails, presign every key as before
+                pass
+
+        for doc in docs:
             # Generate presigned download URL
             try:
-                download_url = await self.s3_repo.generate_presigned_url(
-                    doc.s3_key,
+                doc["download_url"] = self.s3_repo.generate_presigned_url(
+                    doc["s3_key"],
                     operation="get_object",
                 )
-                doc.download_url = download_url
             except Exception:
                 # If URL generation fails, continue without it
                 pass
-            
-            items.append(doc)
-        
-        # Update results with modified items
-        results.items = items
+
         return results
 
     async def get_download_url(self, document_id: int) -> str:
@@ -123,4 +152,4 @@ class DocumentService(BaseService[Document]):
         if not document:
             raise NotFoundError("Document", document_id)
         
-        return await self.s3_repo.generate_presigned_url(document.s3_key, operation="get_object")
+        return self.s3_repo.generate_presigned_url(document.s3_key, operation="get_object")
@@ -1,5 +1,8 @@
 """Role service for business logic."""
+from typing import Optional
+
 from querymate import Querymate
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vibeify_api.models.role import Role
 from vibeify_api.services.base import BaseService
@@ -8,9 +11,13 @@ from vibeify_api.services.base import BaseService
 class RoleService(BaseService[Role]):
     """Service for role-related business logic."""
 
-    def __init__(self):
-        """Initialize role service."""
-        super().__init__(Role)
+    def __init__(self, session: Optional[AsyncSession] = None):
+        """Initialize role service.
+
+        Args:
+            session: Optional request-scoped session
+        """
+        super().__init__(Role, session)
 
     async def get_by_name(self, name: str) -> Role | None:
         """Get a role by name.
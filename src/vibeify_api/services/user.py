@@ -1,7 +1,11 @@
 """User service for business logic."""
+import asyncio
 from datetime import timedelta
+from typing import Optional
 
 from querymate import Querymate
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from vibeify_api.core.exceptions import (
     AlreadyExistsError,
@@ -16,13 +20,31 @@ from vibeify_api.schemas.auth import Token, UserLogin, UserRegister, UserRespons
 from vibeify_api.services.base import BaseService
 from vibeify_api.services.role import RoleService
 
+DEFAULT_ROLE_NAME = "User"
+
+# Unique indexes on users, by the field they cover
+_UNIQUE_INDEX_FIELDS = {"ix_users_email": "email", "ix_users_username": "username"}
+
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# ID of the default role, looked up once on first registration
+_default_role_id: Optional[int] = None
+_default_role_lock = asyncio.Lock()
+
+# Verified against when a login email is unknown, to keep timing uniform
+_DUMMY_PASSWORD_HASH = get_password_hash("not-a-real-password")
+
 
 class UserService(BaseService[User]):
     """Service for user-related business logic."""
 
-    def __init__(self):
-        """Initialize user service."""
-        super().__init__(User)
+    def __init__(self, session: Optional[AsyncSession] = None):
+        """Initialize user service.
+
+        Args:
+            session: Optional request-scoped session
+        """
+        super().__init__(User, session)
 
     async def get_user_profile(self, user_id: int) -> UserResponse:
         """Get user profile.
@@ -54,28 +76,72 @@ class UserService(BaseService[User]):
             AuthorizationError: If user is inactive
         """
         users = await self.query_raw(
-            Querymate(filter={"email": {"eq": user_data.email}}, limit=1),
+            Querymate(
+                filter={"email": {"eq": user_data.email}},
+                select=["id", "hashed_password", "is_active"],
+                limit=1,
+            ),
         )
-        if len(users) == 0:
-            raise AuthenticationError()
-
-        user = users[0]
+        user = users[0] if users else None
 
-        # Verify password
-        if not user.hashed_password or not verify_password(user_data.password, user.hashed_password):
+        # Verify password, against a dummy hash when there is no user, so
+        # response time does not reveal whether the email is registered
+        password_hash = user.hashed_password if user and user.hashed_password else _DUMMY_PASSWORD_HASH
+        password_ok = await asyncio.to_thread(verify_password, user_data.password, password_hash)
+        if not user or not user.hashed_password or not password_ok:
             raise AuthenticationError()
 
         if not user.is_active:
             raise AuthorizationError("Inactive user")
 
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"sub": str(user.id)},
-            expires_delta=access_token_expires,
+            expires_delta=_ACCESS_TOKEN_EXPIRES,
         )
 
         return Token(access_token=access_token, token_type="bearer")
 
+    async def _get_default_role_id(self) -> int:
+        """Get the ID of the role assigned to newly registered users.
+
+        Returns:
+            Default role ID
+
+        Raises:
+            ValidationError: If the default role does not exist
+        """
+        global _default_role_id
+        if _default_role_id is None:
+            async with _default_role_lock:
+                if _default_role_id is None:
+                    default_role = await RoleService(self.session).get_by_name(DEFAULT_ROLE_NAME)
+                    if not default_role:
+                        raise ValidationError("Default user role not found. Please ensure roles are initialized.")
+                    _default_role_id = default_role.id
+        return _default_role_id
+
+    @staticmethod
+    def _unique_violation_field(error: IntegrityError) -> Optional[str]:
+        """Get the user field whose unique index an insert violated.
+
+        Args:
+            error: Integrity error raised by the insert
+
+        Returns:
+            "email" or "username", or None for any other integrity error
+        """
+        # asyncpg reports the violated index on the driver exception
+        constraint = getattr(error.orig.__cause__, "constraint_name", None)
+        if constraint in _UNIQUE_INDEX_FIELDS:
+            return _UNIQUE_INDEX_FIELDS[constraint]
+
+        # Otherwise match the "Key (<column>)=(<value>)" detail, not the value
+        message = str(error.orig)
+        for field in _UNIQUE_INDEX_FIELDS.values():
+            if f"Key ({field})=" in message:
+                return field
+        return None
+
     async def register_user(self, user_data: UserRegister) -> UserResponse:
         """Register a new user.
 
@@ -89,25 +155,9 @@ class UserService(BaseService[User]):
             AlreadyExistsError: If email or username already exists
             ValidationError: If validation fails
         """
-        existing_user = await self.query_raw(
-            Querymate(filter={"email": {"eq": user_data.email}}, limit=1)
-        )
-        if existing_user:
-            raise AlreadyExistsError("User", "email", user_data.email)
-
-        existing_user = await self.query_raw(
-            Querymate(filter={"username": {"eq": user_data.username}}, limit=1)
-        )
-        if existing_user:
-            raise AlreadyExistsError("User", "username", user_data.username)
-
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
 
-        # Get default role (USER)
-        role_service = RoleService()
-        default_role = await role_service.get_by_name("user")
-        if not default_role:
-            raise ValidationError("Default user role not found. Please ensure roles are initialized.")
+        default_role_id = await self._get_default_role_id()
 
         try:
             user = await self.create(
@@ -116,11 +166,21 @@ class UserService(BaseService[User]):
                     username=user_data.username,
                     full_name=user_data.full_name,
                     hashed_password=hashed_password,
-                    role_id=default_role.id,
+                    role_id=default_role_id,
                 )
             )
+        except IntegrityError as e:
+            # Uniqueness is enforced by the email and username unique indexes
+            field = self._unique_violation_field(e)
+            if field == "email":
+                raise AlreadyExistsError("User", "email", user_data.email) from e
+            if field == "username":
+                raise AlreadyExistsError("User", "username", user_data.username) from e
+            raise
         except ValueError as e:
             raise ValidationError(str(e)) from e
 
-        return UserResponse.model_validate(user)
+        # Validate from column values so the unloaded role relationship is not
+        # lazy-loaded outside the async context; role_id identifies it
+        return UserResponse.model_validate(user.model_dump())
 
@@ -1,5 +1,5 @@
 """Example Celery tasks for demonstration."""
-from datetime import datetime
+from datetime import UTC, datetime
 
 from vibeify_api.core.celery_app import celery_app
 from vibeify_api.core.logging import get_logger
@@ -20,7 +20,7 @@ def hello_world(name: str = "World") -> dict:
     logger.info(f"Hello {name} task executed")
     return {
         "message": f"Hello, {name}!",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(UTC).isoformat(),
     }
 
 
@@ -36,9 +36,8 @@ def process_data(data: dict) -> dict:
     """
     logger.info(f"Processing data: {data}")
     # Simulate processing
-    processed = {
-        **data,
+    processed = data | {
         "processed": True,
-        "processed_at": datetime.utcnow().isoformat(),
+        "processed_at": datetime.now(UTC).isoformat(),
     }
     return processed